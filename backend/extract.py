@@ -1,52 +1,182 @@
 """
 Article Text Extraction Module
-Uses Newspaper3k to extract clean text from article URLs
+Uses trafilatura to extract clean text from article URLs
 """
 
+import os
 import logging
-from typing import Optional, List, Dict
-from newspaper import Article
+from dataclasses import dataclass
+from typing import ClassVar, Optional, List, Dict
+import httpx
+import trafilatura
+from cachetools import TTLCache
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
+from utils import normalize_url
+
 logger = logging.getLogger(__name__)
 
+# Download settings
+REQUEST_TIMEOUT = 10.0
+MAX_KEEPALIVE_CONNECTIONS = 64
+MAX_CONNECTIONS = 128
+CONNECT_RETRIES = 1
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# Extraction cache settings (seconds)
+CACHE_SIZE = 1024
+CACHE_TTL = 900
+FAILED_CACHE_TTL = 120
+
+# Parser thread pool size (overridable via EXTRACT_POOL_SIZE)
+DEFAULT_POOL_SIZE = min(32, (os.cpu_count() or 4) * 2)
+
+
+@dataclass
+class ExtractedArticle:
+    """
+    Headline and body text of an extracted article
+    """
+    __slots__ = ("title", "text")
+    
+    title: str
+    text: str
+
 
 class ArticleExtractor:
     """
-    Extract article text from URLs using Newspaper3k
+    Extract article text from URLs using trafilatura
     """
     
+    # Parser pool shared by all instances
+    _executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    
     def __init__(self):
         """
-        Initialize article extractor with thread pool for async operations
+        Initialize article extractor with a shared HTTP/2 client for downloads
         """
-        self.executor = ThreadPoolExecutor(max_workers=5)
+        transport = httpx.AsyncHTTPTransport(
+            http1=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS
+            ),
+            retries=CONNECT_RETRIES  # Retry once on connection errors
+        )
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=REQUEST_TIMEOUT,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT}
+        )
+        
+        # Extraction results keyed by normalized URL; failures expire sooner
+        self._cache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+        self._failed_cache = TTLCache(maxsize=CACHE_SIZE, ttl=FAILED_CACHE_TTL)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        
+        # Warm up trafilatura so its lazy imports don't land on the first worker call
+        trafilatura.extract("<html><body><p>warmup</p></body></html>")
+        
         logger.info("ArticleExtractor initialized successfully")
     
-    async def extract_from_url(self, url: str) -> Optional[str]:
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Get the shared parser thread pool, creating it on first use
+        
+        Returns:
+            Process-wide ThreadPoolExecutor
+        """
+        if cls._executor is None:
+            max_workers = int(os.getenv("EXTRACT_POOL_SIZE", DEFAULT_POOL_SIZE))
+            cls._executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="extract"
+            )
+            logger.info(f"Article parser pool started with {max_workers} workers")
+        return cls._executor
+    
+    @classmethod
+    def shutdown_executor(cls):
+        """
+        Shut down the shared parser thread pool
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+    
+    async def extract_from_url(self, url: str) -> Optional[ExtractedArticle]:
+        """
+        Extract article text from URL asynchronously, using cached results
+        when the same URL was extracted recently
+        
+        Args:
+            url: Article URL to extract text from
+        
+        Returns:
+            Extracted headline and text or None if extraction fails
+        """
+        try:
+            key = normalize_url(url)
+        except ValueError as e:
+            logger.error(f"Invalid article URL {url}: {str(e)}")
+            return None
+        
+        # Serialize concurrent extractions of the same URL
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    logger.debug(f"Extraction cache hit for {url}")
+                    return cached
+                if key in self._failed_cache:
+                    logger.debug(f"Skipping recently failed URL {url}")
+                    return None
+                
+                article_data = await self._extract_uncached(url)
+                if article_data:
+                    self._cache[key] = article_data
+                else:
+                    self._failed_cache[key] = True
+                return article_data
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+    
+    async def _extract_uncached(self, url: str) -> Optional[ExtractedArticle]:
         """
-        Extract article text from URL asynchronously
+        Download and parse an article without consulting the cache
         
         Args:
             url: Article URL to extract text from
         
         Returns:
-            Extracted article text or None if extraction fails
+            Extracted headline and text or None if extraction fails
         """
         try:
-            logger.info(f"Extracting article from: {url}")
+            logger.debug(f"Extracting article from: {url}")
             
-            # Run newspaper3k in thread pool (it's synchronous)
+            # Download asynchronously over the shared client
+            html = await self._download(url)
+            
+            # Run parsing in thread pool (it's synchronous and CPU-bound)
             loop = asyncio.get_event_loop()
             article_data = await loop.run_in_executor(
-                self.executor,
+                self.get_executor(),
                 self._extract_sync,
+                html,
                 url
             )
             
             if article_data:
-                logger.info(f"Successfully extracted {len(article_data)} characters from {url}")
+                logger.debug(f"Successfully extracted {len(article_data.text)} characters from {url}")
                 return article_data
             else:
                 logger.warning(f"No text extracted from {url}")
@@ -69,10 +199,13 @@ class ArticleExtractor:
         try:
             logger.info(f"Extracting article with metadata from: {url}")
             
+            html = await self._download(url)
+            
             loop = asyncio.get_event_loop()
             metadata = await loop.run_in_executor(
-                self.executor,
+                self.get_executor(),
                 self._extract_metadata_sync,
+                html,
                 url
             )
             
@@ -87,64 +220,70 @@ class ArticleExtractor:
             logger.error(f"Failed to extract metadata from {url}: {str(e)}")
             return None
     
-    def _extract_sync(self, url: str) -> Optional[str]:
+    def _extract_sync(self, html: bytes, url: str) -> Optional[ExtractedArticle]:
         """
-        Synchronous article extraction (runs in thread pool)
+        Synchronous article parsing (runs in thread pool)
         
         Args:
-            url: Article URL
+            html: Downloaded page HTML (raw bytes)
+            url: Article URL (used for logging)
         
         Returns:
-            Extracted text with headline or None
+            Extracted headline and text or None
         """
         try:
-            # Create article object
-            article = Article(url)
-            
-            # Download and parse
-            article.download()
-            article.parse()
-            
-            # Get text
-            text = article.text
+            # Parse main text
+            text = trafilatura.extract(
+                html,
+                include_comments=False,
+                include_tables=False,
+                fast=True,
+                favor_precision=True
+            )
+            text = text.strip() if text else ""
+            if not text:
+                return None
             
-            # Include headline at the top
-            if article.title:
-                text = f"HEADLINE: {article.title}\n\n{text}"
+            meta = trafilatura.extract_metadata(html)
+            title = (meta.title if meta else None) or ""
             
-            return text.strip() if text else None
+            return ExtractedArticle(title=title.strip(), text=text)
         
         except Exception as e:
             logger.error(f"Sync extraction failed for {url}: {str(e)}")
             return None
     
-    def _extract_metadata_sync(self, url: str) -> Optional[Dict[str, str]]:
+    def _extract_metadata_sync(self, html: bytes, url: str) -> Optional[Dict[str, str]]:
         """
-        Synchronous article extraction with full metadata
+        Synchronous article parsing with full metadata (runs in thread pool)
         
         Args:
+            html: Downloaded page HTML (raw bytes)
             url: Article URL
         
         Returns:
             Dictionary with article metadata or None
         """
         try:
-            # Create article object
-            article = Article(url)
-            
-            # Download and parse
-            article.download()
-            article.parse()
+            # Parse text and metadata
+            text = trafilatura.extract(
+                html,
+                include_comments=False,
+                include_tables=False,
+                fast=True,
+                favor_precision=True
+            )
+            meta = trafilatura.extract_metadata(html)
             
             # Extract all metadata
             metadata = {
                 'url': url,
-                'title': article.title or 'No title',
-                'text': article.text or '',
-                'authors': ', '.join(article.authors) if article.authors else 'Unknown',
-                'publish_date': str(article.publish_date) if article.publish_date else 'Unknown',
-                'top_image': article.top_image or '',
-                'summary': article.summary if hasattr(article, 'summary') else ''
+                'title': (meta.title if meta else None) or 'No title',
+                'text': text or '',
+                'authors': (meta.author if meta else None) or 'Unknown',
+                'publish_date': (meta.date if meta else None) or 'Unknown',
+                'top_image': (meta.image if meta else None) or '',
+                'summary': (meta.description if meta else None) or ''
             }
             
             return metadata if metadata['text'] else None
@@ -153,7 +292,22 @@ class ArticleExtractor:
             logger.error(f"Metadata extraction failed for {url}: {str(e)}")
             return None
     
-    async def extract_multiple(self, urls: List[str]) -> Dict[str, Optional[str]]:
+    async def _download(self, url: str) -> bytes:
+        """
+        Download raw page HTML using the shared HTTP client
+        
+        Args:
+            url: Article URL
+        
+        Returns:
+            Undecoded page HTML - trafilatura detects the encoding, including
+            <meta charset> declarations that httpx ignores
+        """
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response.content
+    
+    async def extract_multiple(self, urls: List[str]) -> Dict[str, Optional[ExtractedArticle]]:
         """
         Extract text from multiple URLs concurrently
         
@@ -161,7 +315,7 @@ class ArticleExtractor:
             urls: List of URLs to extract from
         
         Returns:
-            Dictionary mapping URLs to extracted text
+            Dictionary mapping URLs to extracted articles
         """
         try:
             logger.info(f"Extracting text from {len(urls)} URLs...")
@@ -190,9 +344,9 @@ class ArticleExtractor:
             logger.error(f"Batch extraction failed: {str(e)}")
             return {url: None for url in urls}
     
-    def __del__(self):
+    async def close(self):
         """
-        Cleanup thread pool on deletion
+        Close the shared HTTP client
         """
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
+        await self._client.aclose()
+
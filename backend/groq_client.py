@@ -4,9 +4,12 @@ Uses LLaMA 3.1 or Mixtral for content analysis
 """
 
 import os
-import json
+import time
+import asyncio
+import string
 import logging
 from typing import Dict, List, Any
+import orjson
 from groq import AsyncGroq
 from dotenv import load_dotenv
 
@@ -15,6 +18,23 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Verification prompt template, loaded once at import
+_PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts", "verification.tmpl")
+with open(_PROMPT_PATH, encoding="utf-8") as _f:
+    _PROMPT_TMPL = string.Template(_f.read().rstrip("\n"))
+
+_SOURCE_TMPL = string.Template("""
+━━━ Source ${index} ━━━
+Title: ${title}
+Publisher: ${source}
+URL: ${url}
+Content Preview: ${text}
+━━━━━━━━━━━━━━━━━━━
+""")
+
+# Responses larger than this (characters) are parsed off the event loop
+OFFLOAD_PARSE_THRESHOLD = 4096
+
 
 class GroqClient:
     """
@@ -39,115 +59,67 @@ class GroqClient:
         ]
         self.current_model = self.models[0]
         
+        # Constant system message, shared by every verification request
+        self._system_msg = {
+            "role": "system",
+            "content": "You are a professional fact-checker and news analyst. Analyze news content critically and verify against credible sources. Always respond with valid JSON only."
+        }
+        
         logger.info(f"Groq client initialized with model: {self.current_model}")
     
     def _create_verification_prompt(
         self,
         main_content: str,
         related_articles: List[Dict[str, str]],
-        is_url: bool = False
+        is_url: bool = False,
+        headline: str = ""
     ) -> str:
         """
         Create a detailed prompt for news verification
         
         Args:
-            main_content: Main news content to verify
+            main_content: Main news content to verify (already truncated by the caller)
             related_articles: List of related article data
             is_url: Whether the content came from a URL
+            headline: Article headline, if known
         
         Returns:
             Formatted prompt string
         """
+        return _PROMPT_TMPL.substitute(
+            headline=f"\nHEADLINE: {headline}\n" if headline else "",
+            content=main_content,
+            sources=self._render_sources(related_articles[:5])
+        )
+    
+    @staticmethod
+    def _render_sources(related_articles: List[Dict[str, str]]) -> str:
+        """
+        Render related articles as numbered source blocks
         
-        # Extract headline if present
-        headline = ""
-        content_body = main_content
-        if main_content.startswith("HEADLINE:"):
-            lines = main_content.split('\n', 2)
-            headline = lines[0].replace("HEADLINE:", "").strip()
-            content_body = lines[2] if len(lines) > 2 else lines[1] if len(lines) > 1 else ""
-        
-        prompt = f"""You are an expert fact-checker and news analyst. Your task is to verify news content by analyzing it against credible sources.
-
-{'=' * 80}
-ARTICLE TO VERIFY:
-{'=' * 80}"""
-
-        if headline:
-            prompt += f"""
-HEADLINE: {headline}
-"""
-        
-        prompt += f"""
-CONTENT:
-{content_body[:2500]}
-
-{'=' * 80}
-RELATED NEWS SOURCES FOR VERIFICATION:
-{'=' * 80}
-"""
-        
-        for idx, article in enumerate(related_articles[:5], 1):
-            prompt += f"""
-━━━ Source {idx} ━━━
-Title: {article.get('title', 'Untitled')}
-Publisher: {article.get('source', 'Unknown')}
-URL: {article.get('url', 'N/A')}
-Content Preview: {article.get('text', '')[:500]}
-━━━━━━━━━━━━━━━━━━━
-"""
-        
-        prompt += f"""
-
-{'=' * 80}
-VERIFICATION TASK:
-{'=' * 80}
-
-1. ANALYZE THE HEADLINE (if present):
-   - Is it sensationalized or clickbait?
-   - Does it accurately represent the content?
-   - Is it making extraordinary claims?
-
-2. VERIFY THE CONTENT:
-   - Cross-reference with the related sources above
-   - Check if key facts match credible sources
-   - Identify any contradictions or inconsistencies
-   - Look for evidence of manipulation or misinformation
-
-3. DETERMINE VERDICT:
-   - **True**: Verified by multiple credible sources, facts are accurate
-   - **False**: Contradicted by credible sources, contains false information
-   - **Misleading**: Partially true but missing critical context or exaggerated
-   - **Unverified**: Insufficient credible sources to confirm or deny
-
-4. PROVIDE:
-   - A verdict (EXACTLY one of: True, False, Misleading, Unverified)
-   - A confidence score (0-100) based on source quality and consistency
-   - A clear, detailed summary explaining:
-     * What the article claims
-     * What you found in credible sources
-     * Why you reached this verdict
-     * Any important context or caveats
-
-{'=' * 80}
-RESPOND ONLY WITH VALID JSON - NO OTHER TEXT:
-{'=' * 80}
-
-{{
-    "verdict": "True|False|Misleading|Unverified",
-    "confidence": 0-100,
-    "summary": "Detailed explanation of your analysis, including what the headline/content claims and what you found in credible sources"
-}}
-
-CRITICAL: Output ONLY the JSON object above. No markdown, no code blocks, no additional text."""
+        Args:
+            related_articles: Related article data (previews already truncated by the caller)
         
-        return prompt
+        Returns:
+            Concatenated source blocks
+        """
+        return "".join([
+            _SOURCE_TMPL.substitute(
+                index=idx,
+                title=article.get('title', 'Untitled'),
+                source=article.get('source', 'Unknown'),
+                url=article.get('url', 'N/A'),
+                text=article.get('text') or ''
+            )
+            for idx, article in enumerate(related_articles, 1)
+        ])
     
     async def verify_news(
         self,
         main_content: str,
         related_articles: List[Dict[str, str]],
-        is_url: bool = False
+        is_url: bool = False,
+        headline: str = ""
     ) -> Dict[str, Any]:
         """
         Verify news content using Groq AI
@@ -156,23 +128,30 @@ CRITICAL: Output ONLY the JSON object above. No markdown, no code blocks, no add
             main_content: Main content to verify
             related_articles: Related articles for context
             is_url: Whether the content came from a URL
+            headline: Article headline, if known
         
         Returns:
             Dictionary with verdict, confidence, summary, and evidence_links
         """
         try:
-            # Create verification prompt
-            prompt = self._create_verification_prompt(main_content, related_articles, is_url)
+            # Create verification prompt off the event loop
+            loop = asyncio.get_running_loop()
+            prompt = await loop.run_in_executor(
+                None,
+                self._create_verification_prompt,
+                main_content,
+                related_articles,
+                is_url,
+                headline
+            )
             
             logger.info(f"Sending verification request to Groq ({self.current_model})...")
             
-            # Call Groq API
-            chat_completion = await self.client.chat.completions.create(
+            # Call Groq API, streaming tokens as they are generated
+            started = time.perf_counter()
+            stream = await self.client.chat.completions.create(
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional fact-checker and news analyst. Analyze news content critically and verify against credible sources. Always respond with valid JSON only."
-                    },
+                    self._system_msg,
                     {
                         "role": "user",
                         "content": prompt
@@ -181,22 +160,37 @@ CRITICAL: Output ONLY the JSON object above. No markdown, no code blocks, no add
                 model=self.current_model,
                 temperature=0.2,  # Lower temperature for more consistent, factual output
                 max_tokens=1500,
-                top_p=0.9
+                top_p=0.9,
+                response_format={"type": "json_object"},  # JSON mode: reply is a bare JSON object
+                stream=True
             )
             
-            # Extract response
-            response_text = chat_completion.choices[0].message.content.strip()
-            logger.info(f"Received response from Groq: {len(response_text)} characters")
+            # Accumulate streamed response
+            chunks = []
+            first_token_at = None
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    chunks.append(delta)
+            response_text = "".join(chunks).strip()
+            
+            elapsed = time.perf_counter() - started
+            ttft = (first_token_at - started) if first_token_at is not None else elapsed
+            logger.info(
+                f"Received response from Groq: {len(response_text)} characters "
+                f"in {elapsed:.2f}s (first token after {ttft:.2f}s)"
+            )
             
             # Parse JSON response
             try:
-                # Try to extract JSON if wrapped in markdown code blocks
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    response_text = response_text.split("```")[1].split("```")[0].strip()
-                
-                result = json.loads(response_text)
+                if len(response_text) > OFFLOAD_PARSE_THRESHOLD:
+                    result = await loop.run_in_executor(None, orjson.loads, response_text)
+                else:
+                    result = orjson.loads(response_text)
                 
                 # Validate required fields
                 required_fields = ["verdict", "confidence", "summary"]
@@ -217,7 +211,7 @@ CRITICAL: Output ONLY the JSON object above. No markdown, no code blocks, no add
                 logger.info(f"Successfully parsed verification result: {result['verdict']}")
                 return result
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {str(e)}")
                 logger.error(f"Response text: {response_text}")
                 
@@ -6,20 +6,47 @@ Provides endpoint for verifying news content using AI and web search
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import urlparse
 
 from models import VerifyRequest, VerifyResponse, HealthResponse
 from groq_client import GroqClient
 from news_search import NewsSearcher
 from extract import ArticleExtractor
+from utils import article_dedup_key
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging - request handlers only enqueue records, a background
+# listener thread formats and writes them. The handler is attached in lifespan
+# so it always pairs with the running listener, even when this module is
+# imported twice (as __main__ and again as "main" by uvicorn)
+log_queue = queue.Queue(-1)
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+log_listener = QueueListener(log_queue, log_stream_handler, respect_handler_level=True)
+log_queue_handler = QueueHandler(log_queue)
+log_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final formatting happens in the listener
+
+# httpx logs every request URL at INFO, including the SerpAPI key in the query string
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Per-URL and overall bounds (seconds) for related article extraction
+RELATED_EXTRACTION_TIMEOUT = 8
+RELATED_EXTRACTION_DEADLINE = 10
+
+# Number of related sources used as evidence
+MAX_RELATED_SOURCES = 5
+
+# Text kept per request: main article body and each related preview
+MAIN_CONTENT_LIMIT = 2500
+RELATED_PREVIEW_LIMIT = 500
+
 # Global instances
 groq_client = None
 news_searcher = None
@@ -33,6 +60,10 @@ async def lifespan(app: FastAPI):
     """
     global groq_client, news_searcher, article_extractor
     
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(log_queue_handler)
+    log_listener.start()
     logger.info("Initializing News Verification API...")
     
     try:
@@ -40,6 +71,7 @@ async def lifespan(app: FastAPI):
         groq_client = GroqClient()
         news_searcher = NewsSearcher()
         article_extractor = ArticleExtractor()
+        ArticleExtractor.get_executor()
         
         logger.info("All services initialized successfully")
         yield
@@ -49,6 +81,13 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         logger.info("Shutting down News Verification API...")
+        if news_searcher:
+            await news_searcher.close()
+        if article_extractor:
+            await article_extractor.close()
+        ArticleExtractor.shutdown_executor()
+        log_listener.stop()
+        root_logger.removeHandler(log_queue_handler)
 
 
 # Create FastAPI application
@@ -102,6 +141,29 @@ async def health_check():
         raise HTTPException(status_code=503, detail=str(e))
 
 
+async def _extract_related(article: dict) -> tuple:
+    """
+    Extract a related article's text within the per-URL timeout
+    
+    Args:
+        article: Related article data from the news search
+    
+    Returns:
+        Tuple of (article, extracted text or None)
+    """
+    try:
+        extracted = await asyncio.wait_for(
+            article_extractor.extract_from_url(article['url']),
+            timeout=RELATED_EXTRACTION_TIMEOUT
+        )
+        return article, extracted.text if extracted else None
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out extracting from {article['url']}")
+    except Exception as e:
+        logger.warning(f"Failed to extract from {article['url']}: {str(e)}")
+    return article, None
+
+
 @app.post("/verify", response_model=VerifyResponse)
 async def verify_news(request: VerifyRequest):
     """
@@ -124,37 +186,41 @@ async def verify_news(request: VerifyRequest):
         logger.info(f"Starting verification for content: {request.content[:100]}...")
         
         # Step 1: Extract main content if URL
-        main_content = request.content
+        main_content = request.content[:MAIN_CONTENT_LIMIT]
+        headline = ""
         is_url = request.content.startswith(('http://', 'https://'))
         extraction_failed = False
         
         if is_url:
             logger.info(f"Detected URL, extracting article with headline...")
+            parsed = urlparse(request.content)
             try:
                 extracted = await article_extractor.extract_from_url(request.content)
-                if extracted and len(extracted) > 50:  # Ensure meaningful content
-                    main_content = extracted
-                    logger.info(f"Successfully extracted {len(main_content)} characters")
+                if extracted and len(extracted.text) > 50:  # Ensure meaningful content
+                    logger.info(f"Successfully extracted {len(extracted.text)} characters")
+                    headline = extracted.title
+                    main_content = extracted.text[:MAIN_CONTENT_LIMIT]
                 else:
                     logger.warning("Extraction returned insufficient content, will search based on URL")
                     extraction_failed = True
                     # Use URL domain and path as search query
-                    from urllib.parse import urlparse
-                    parsed = urlparse(request.content)
                     main_content = f"News article from {parsed.netloc} - {parsed.path.replace('/', ' ')}"
             except Exception as e:
                 logger.warning(f"Failed to extract article: {str(e)}")
                 extraction_failed = True
                 # Use URL as search query
-                from urllib.parse import urlparse
-                parsed = urlparse(request.content)
                 main_content = f"News from {parsed.netloc}"
         
         # Step 2: Search for related news articles
         logger.info("Searching for related news articles...")
         try:
             # Create better search query
-            search_query = main_content[:500] if not extraction_failed else request.content
+            if extraction_failed:
+                search_query = request.content
+            elif headline:
+                search_query = f"{headline} {main_content[:500]}"
+            else:
+                search_query = main_content[:500]
             
             related_articles = await news_searcher.search_related_news(
                 query=search_query,
@@ -184,20 +250,42 @@ async def verify_news(request: VerifyRequest):
         related_contents = []
         evidence_links = []
         
+        # Skip the input URL, duplicate URLs and unparsable URLs so nothing is fetched twice
+        seen = {article_dedup_key(request.content)} if is_url else set()
+        unique_articles = []
         for article in related_articles:
-            try:
-                article_text = await article_extractor.extract_from_url(article['url'])
-                if article_text:
-                    related_contents.append({
-                        'title': article.get('title', 'Untitled'),
-                        'source': article.get('source', 'Unknown'),
-                        'url': article['url'],
-                        'text': article_text[:1000]  # Limit to first 1000 chars
-                    })
-                    evidence_links.append(article['url'])
-            except Exception as e:
-                logger.warning(f"Failed to extract from {article['url']}: {str(e)}")
+            key = article_dedup_key(article['url'])
+            if key is None or key in seen:
                 continue
+            seen.add(key)
+            unique_articles.append(article)
+        related_articles = unique_articles
+        
+        # Fetch related articles concurrently and keep the first ones to finish
+        tasks = [
+            asyncio.create_task(_extract_related(article))
+            for article in related_articles
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=RELATED_EXTRACTION_DEADLINE):
+                article, article_text = await next_done
+                if not article_text:
+                    continue
+                related_contents.append({
+                    'title': article.get('title', 'Untitled'),
+                    'source': article.get('source', 'Unknown'),
+                    'url': article['url'],
+                    'text': article_text[:RELATED_PREVIEW_LIMIT]
+                })
+                evidence_links.append(article['url'])
+                if len(related_contents) >= MAX_RELATED_SOURCES:
+                    break
+        except asyncio.TimeoutError:
+            logger.warning("Related article extraction deadline reached, continuing with partial results")
+        finally:
+            # Stop any slow extractions still in flight
+            for task in tasks:
+                task.cancel()
         
         logger.info(f"Successfully extracted text from {len(related_contents)} articles")
         
@@ -206,12 +294,13 @@ async def verify_news(request: VerifyRequest):
         try:
             analysis = await groq_client.verify_news(
                 main_content=main_content,
+                headline=headline,
                 related_articles=related_contents,
                 is_url=is_url
             )
             
             # Add evidence links to the response
-            analysis['evidence_links'] = evidence_links[:5]  # Limit to top 5
+            analysis['evidence_links'] = evidence_links[:MAX_RELATED_SOURCES]
             
             logger.info(f"Analysis complete. Verdict: {analysis['verdict']}")
             
@@ -235,11 +324,15 @@ async def verify_news(request: VerifyRequest):
 
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop is not available on Windows
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
         log_level="info"
     )
@@ -2,8 +2,8 @@
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Literal, Optional
 from enum import Enum
 
 
@@ -17,10 +17,23 @@ class VerdictType(str, Enum):
     UNVERIFIED = "Unverified"
 
 
+VerdictLiteral = Literal["True", "False", "Misleading", "Unverified"]
+_ALLOWED_VERDICTS = frozenset(v.value for v in VerdictType)
+_VERDICTS_BY_LOWER = {v.lower(): v for v in _ALLOWED_VERDICTS}
+
+
 class VerifyRequest(BaseModel):
     """
     Request model for news verification endpoint
     """
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "content": "https://example.com/news-article or text content here"
+            }
+        }
+    )
+    
     content: str = Field(
         ...,
         description="News content to verify (can be text or URL)",
@@ -28,7 +41,8 @@ class VerifyRequest(BaseModel):
         max_length=10000
     )
     
-    @validator('content')
+    @field_validator('content')
+    @classmethod
     def validate_content(cls, v):
         """
         Validate that content is not empty or just whitespace
@@ -36,20 +50,27 @@ class VerifyRequest(BaseModel):
         if not v.strip():
             raise ValueError("Content cannot be empty")
         return v.strip()
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "content": "https://example.com/news-article or text content here"
-            }
-        }
 
 
 class VerifyResponse(BaseModel):
     """
     Response model for news verification endpoint
     """
-    verdict: str = Field(
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "verdict": "Misleading",
+                "confidence": 75,
+                "summary": "The claim contains partial truth but lacks important context...",
+                "evidence_links": [
+                    "https://example.com/source1",
+                    "https://example.com/source2"
+                ]
+            }
+        }
+    )
+    
+    verdict: VerdictLiteral = Field(
         ...,
         description="Verification verdict: True, False, Misleading, or Unverified"
     )
@@ -68,48 +89,35 @@ class VerifyResponse(BaseModel):
         description="List of URLs used as evidence"
     )
     
-    @validator('verdict')
+    @field_validator('verdict', mode='before')
+    @classmethod
     def validate_verdict(cls, v):
         """
-        Ensure verdict is one of the allowed values
+        Map verdicts case-insensitively onto the allowed values,
+        falling back to Unverified
         """
-        allowed = ["True", "False", "Misleading", "Unverified"]
-        if v not in allowed:
-            # Try to match case-insensitively
-            for allowed_verdict in allowed:
-                if v.lower() == allowed_verdict.lower():
-                    return allowed_verdict
-            return "Unverified"
-        return v
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "verdict": "Misleading",
-                "confidence": 75,
-                "summary": "The claim contains partial truth but lacks important context...",
-                "evidence_links": [
-                    "https://example.com/source1",
-                    "https://example.com/source2"
-                ]
-            }
-        }
+        if isinstance(v, str):
+            if v in _ALLOWED_VERDICTS:
+                return v
+            return _VERDICTS_BY_LOWER.get(v.lower(), "Unverified")
+        return "Unverified"
 
 
 class HealthResponse(BaseModel):
     """
     Response model for health check endpoints
     """
-    status: str = Field(..., description="Service status")
-    message: str = Field(..., description="Status message")
-    
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "message": "All services operational"
             }
         }
+    )
+    
+    status: str = Field(..., description="Service status")
+    message: str = Field(..., description="Status message")
 
 
 class NewsArticle(BaseModel):
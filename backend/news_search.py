@@ -4,16 +4,117 @@ Searches for related news articles to verify claims
 """
 
 import os
+import re
+import asyncio
 import logging
-from typing import List, Dict, Any
-from serpapi import GoogleSearch
+import sqlite3
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
+from utils import extract_domain, article_dedup_key
+from response_cache import ResponseCache
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# SerpAPI endpoint and connection settings
+SERPAPI_URL = "https://serpapi.com/search.json"
+REQUEST_TIMEOUT = 15.0
+MAX_CONNECTIONS = 32
+KEEPALIVE_EXPIRY = 60.0
+
+# Whitespace-delimited tokens that start with a URL scheme or www.
+_URL_TOKEN_RE = re.compile(r'(?<!\S)(?:https?://|www\.)\S*')
+
+# Output article field -> SerpAPI result field (None leaves the field empty)
+_NEWS_KEYS = (
+    ("title", "title"),
+    ("url", "link"),
+    ("source", "source"),
+    ("snippet", "snippet"),
+    ("published_date", "date")
+)
+_ORGANIC_KEYS = (
+    ("title", "title"),
+    ("url", "link"),
+    ("source", "displayed_link"),
+    ("snippet", "snippet"),
+    ("published_date", None)
+)
+
+# Search result cache settings (seconds)
+CACHE_SIZE = 512
+CACHE_TTL = 600
+
+# Identical queries arriving within this window (seconds) share one SerpAPI call
+SEARCH_BATCH_WINDOW = 0.02
+
+# Optional semantic cache: set SEMANTIC_CACHE_MODEL to a sentence-transformers model to enable
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_SIZE = 256
+
+# Persistent SerpAPI response cache: set SERPAPI_CACHE_PATH to an empty string to disable
+DISK_CACHE_PATH = os.getenv("SERPAPI_CACHE_PATH", "serpapi_cache.sqlite")
+DISK_CACHE_TTL = 3600
+
+
+def _to_article(item: Dict[str, Any], keys: Tuple[Tuple[str, Optional[str]], ...]) -> Dict[str, str]:
+    """
+    Convert a SerpAPI result item to an article dictionary
+    
+    Args:
+        item: SerpAPI result item
+        keys: Field map such as _NEWS_KEYS or _ORGANIC_KEYS
+    
+    Returns:
+        Article dictionary with title, url, source, snippet, published_date
+    """
+    return {out: item.get(field, "") if field else "" for out, field in keys}
+
+
+@lru_cache(maxsize=1024)
+def _prepare_search_query_cached(content: str) -> str:
+    """
+    Build a search query from a content prefix (memoized)
+    
+    Args:
+        content: Content prefix, at most 200 characters
+    
+    Returns:
+        Search query string
+    """
+    query = content.strip()
+    
+    # Remove URLs from query (substring checks skip the regex for plain text)
+    if 'http' in query or 'www.' in query:
+        query = _URL_TOKEN_RE.sub('', query)
+    
+    # Normalize whitespace
+    query = ' '.join(query.split())
+    
+    # Limit to reasonable length
+    if len(query) > 150:
+        query = query[:150].rsplit(' ', 1)[0]
+    
+    return query
+
+
+@dataclass
+class _PendingSearch:
+    """
+    A coalesced search waiting for its batching window or SerpAPI response
+    """
+    num_results: int
+    started: bool = False
+    task: Optional[asyncio.Future] = None
+
 
 class NewsSearcher:
     """
@@ -28,6 +129,37 @@ class NewsSearcher:
         if not self.api_key:
             raise ValueError("SERPAPI_KEY not found in environment variables")
         
+        # Pooled HTTP client, created on first search
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # (num_results, articles) keyed by search query, plus pending searches
+        # so concurrent duplicate queries share one request
+        self._cache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+        self._pending: Dict[str, _PendingSearch] = {}
+        
+        # Near-match cache for reworded queries (optional dependency)
+        self._semantic = None
+        model_name = os.getenv("SEMANTIC_CACHE_MODEL")
+        if model_name:
+            try:
+                from semantic_cache import SemanticCache
+                self._semantic = SemanticCache(
+                    model_name,
+                    threshold=SEMANTIC_CACHE_THRESHOLD,
+                    max_entries=SEMANTIC_CACHE_SIZE,
+                    ttl=CACHE_TTL
+                )
+            except ImportError as e:
+                logger.warning(f"Semantic cache disabled, missing dependency: {str(e)}")
+        
+        # On-disk SerpAPI responses beneath the in-memory cache, shared across restarts and workers
+        self._disk = None
+        if DISK_CACHE_PATH:
+            try:
+                self._disk = ResponseCache(DISK_CACHE_PATH, ttl=DISK_CACHE_TTL)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache disabled: {str(e)}")
+        
         logger.info("NewsSearcher initialized successfully")
     
     async def search_related_news(
@@ -51,54 +183,125 @@ class NewsSearcher:
             # Prepare search query - extract key terms
             search_query = self._prepare_search_query(query)
             
-            # Configure SerpAPI search
-            search_params = {
-                "q": search_query,
-                "tbm": "nws",  # News search
-                "api_key": self.api_key,
-                "num": min(num_results, 10),  # SerpAPI usually returns up to 10
-                "gl": "us",  # Country
-                "hl": "en"   # Language
-            }
-            
-            # Execute search
-            search = GoogleSearch(search_params)
-            results = search.get_dict()
+            cached = self._cache.get(search_query)
+            if cached is not None and cached[0] >= num_results:
+                articles = cached[1][:num_results]
+                logger.info(f"Search cache hit, {len(articles)} related articles")
+                return articles
             
-            # Extract news results
-            articles = []
+            # Fall back to a semantically similar earlier query
+            embedding = None
+            if self._semantic is not None:
+                loop = asyncio.get_running_loop()
+                embedding = await loop.run_in_executor(None, self._semantic.encode, search_query)
+                cached = self._semantic.lookup(embedding)
+                if cached is not None:
+                    logger.info(f"Semantic cache hit, {len(cached)} related articles")
+                    return list(cached[:num_results])
             
-            # Check for news results
-            if "news_results" in results:
-                for item in results["news_results"][:num_results]:
-                    article = {
-                        "title": item.get("title", ""),
-                        "url": item.get("link", ""),
-                        "source": item.get("source", ""),
-                        "snippet": item.get("snippet", ""),
-                        "published_date": item.get("date", "")
-                    }
-                    articles.append(article)
+            # Join a pending search for the same query, or start one. Searches
+            # still in their batching window grow to the largest num_results asked.
+            pending = self._pending.get(search_query)
+            owner = pending is None or (pending.started and pending.num_results < num_results)
+            if owner:
+                pending = _PendingSearch(num_results=num_results)
+                self._pending[search_query] = pending
+                pending.task = asyncio.ensure_future(self._run_pending(search_query, pending))
+            elif not pending.started:
+                pending.num_results = max(pending.num_results, num_results)
             
-            # Also check organic results if not enough news results
-            if len(articles) < num_results and "organic_results" in results:
-                for item in results["organic_results"][:num_results - len(articles)]:
-                    article = {
-                        "title": item.get("title", ""),
-                        "url": item.get("link", ""),
-                        "source": item.get("displayed_link", ""),
-                        "snippet": item.get("snippet", ""),
-                        "published_date": ""
-                    }
-                    articles.append(article)
-            
-            logger.info(f"Found {len(articles)} related articles")
-            return articles
+            articles = await asyncio.shield(pending.task)
+            if owner and embedding is not None and articles:
+                self._semantic.add(embedding, articles)
+            return articles[:num_results]
         
         except Exception as e:
             logger.error(f"News search failed: {str(e)}", exc_info=True)
             return []
     
+    async def _run_pending(self, search_query: str, pending: _PendingSearch) -> List[Dict[str, Any]]:
+        """
+        Wait out the batching window, then run and cache a coalesced search
+        
+        Args:
+            search_query: Prepared search query
+            pending: Pending search shared by all waiters
+        
+        Returns:
+            List of article dictionaries
+        """
+        try:
+            await asyncio.sleep(SEARCH_BATCH_WINDOW)
+            pending.started = True
+            articles = await self._search(search_query, pending.num_results)
+            # A superseded smaller search can finish last; keep the larger cached result
+            cached = self._cache.get(search_query)
+            if cached is None or cached[0] <= pending.num_results:
+                self._cache[search_query] = (pending.num_results, articles)
+            return articles
+        finally:
+            if self._pending.get(search_query) is pending:
+                del self._pending[search_query]
+    
+    async def _search(self, search_query: str, num_results: int) -> List[Dict[str, Any]]:
+        """
+        Run a news search against SerpAPI without consulting the cache
+        
+        Args:
+            search_query: Prepared search query
+            num_results: Number of results to return
+        
+        Returns:
+            List of article dictionaries with title, url, source, snippet
+        """
+        # Configure SerpAPI searches: news tab and regular web results
+        common_params = {
+            "q": search_query,
+            "api_key": self.api_key,
+            "num": min(num_results, 10),  # SerpAPI usually returns up to 10
+            "gl": "us",  # Country
+            "hl": "en"   # Language
+        }
+        news_params = {**common_params, "tbm": "nws"}  # News search
+        
+        # Execute both searches concurrently
+        news_results, web_results = await asyncio.gather(
+            self._fetch(news_params),
+            self._fetch(common_params),
+            return_exceptions=True
+        )
+        if isinstance(news_results, BaseException) and isinstance(web_results, BaseException):
+            raise news_results
+        if isinstance(news_results, BaseException):
+            logger.warning(f"News tab search failed, using web results only: {str(news_results)}")
+            news_results = {}
+        if isinstance(web_results, BaseException):
+            logger.warning(f"Web search failed, using news results only: {str(web_results)}")
+            web_results = {}
+        
+        # Merge news results first, then organic results, skipping duplicate URLs
+        articles = []
+        seen = set()
+        sources = (
+            (_NEWS_KEYS, news_results.get("news_results", ())),
+            (_ORGANIC_KEYS, web_results.get("organic_results", ()))
+        )
+        for keys, items in sources:
+            for item in items:
+                if len(articles) >= num_results:
+                    break
+                article = _to_article(item, keys)
+                if not article["url"]:
+                    continue
+                key = article_dedup_key(article["url"])
+                if key is None or key in seen:
+                    continue
+                seen.add(key)
+                articles.append(article)
+        
+        logger.info(f"Found {len(articles)} related articles")
+        return articles
+    
     def _prepare_search_query(self, content: str) -> str:
         """
         Prepare search query from content
@@ -110,21 +313,8 @@ class NewsSearcher:
         Returns:
             Optimized search query string
         """
-        # Take first 200 characters and clean up
-        query = content[:200].strip()
-        
-        # Remove URLs from query
-        words = []
-        for word in query.split():
-            if not word.startswith(('http://', 'https://', 'www.')):
-                words.append(word)
-        
-        query = ' '.join(words)
-        
-        # Limit to reasonable length
-        if len(query) > 150:
-            query = query[:150].rsplit(' ', 1)[0]
-        
+        # Only the first 200 characters are used, which also bounds the cache key size
+        query = _prepare_search_query_cached(content[:200])
         logger.debug(f"Prepared search query: {query}")
         return query
     
@@ -141,8 +331,7 @@ class NewsSearcher:
         """
         try:
             # Extract domain for search
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
+            domain = extract_domain(url)
             
             search_params = {
                 "q": f"site:{domain} OR related:{url}",
@@ -153,23 +342,75 @@ class NewsSearcher:
                 "hl": "en"
             }
             
-            search = GoogleSearch(search_params)
-            results = search.get_dict()
-            
-            articles = []
-            if "news_results" in results:
-                for item in results["news_results"]:
-                    article = {
-                        "title": item.get("title", ""),
-                        "url": item.get("link", ""),
-                        "source": item.get("source", ""),
-                        "snippet": item.get("snippet", ""),
-                        "published_date": item.get("date", "")
-                    }
-                    articles.append(article)
+            results = await self._fetch(search_params)
             
-            return articles
+            return [_to_article(item, _NEWS_KEYS) for item in results.get("news_results", ())]
         
         except Exception as e:
             logger.error(f"URL-based search failed: {str(e)}")
             return []
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use
+        
+        Returns:
+            Pooled keep-alive AsyncClient
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY
+                ),
+                timeout=REQUEST_TIMEOUT
+            )
+        return self._client
+    
+    async def _fetch(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a SerpAPI search request, served from the disk cache when possible
+        
+        Args:
+            search_params: SerpAPI query parameters
+        
+        Returns:
+            Decoded JSON response
+        """
+        if self._disk is not None:
+            loop = asyncio.get_running_loop()
+            key = self._disk.make_key(search_params)
+            body = await loop.run_in_executor(None, self._disk.get, key)
+            if body is not None:
+                logger.debug("SerpAPI disk cache hit")
+                return orjson.loads(body)
+        
+        response = await self._get_client().get(SERPAPI_URL, params=search_params)
+        if response.is_error:
+            # Not raise_for_status(): its message carries the request URL, api_key included
+            try:
+                detail = orjson.loads(response.content).get("error", "")
+            except (orjson.JSONDecodeError, AttributeError):
+                detail = ""
+            raise RuntimeError(
+                f"SerpAPI request failed with status {response.status_code}"
+                + (f": {detail}" if detail else "")
+            )
+        results = orjson.loads(response.content)
+        
+        # Only cache successful searches; SerpAPI reports some failures in the body
+        if self._disk is not None and "error" not in results:
+            await loop.run_in_executor(None, self._disk.set, key, response.content)
+        return results
+    
+    async def close(self):
+        """
+        Close the shared HTTP client and the disk cache
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
@@ -0,0 +1,108 @@
+"""
+Persistent Response Cache Module
+Stores raw SerpAPI responses in SQLite so they survive restarts and are shared across workers
+"""
+
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Request parameters that do not affect the response
+_IGNORED_PARAMS = frozenset({"api_key"})
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of HTTP response bodies keyed by request parameters
+    """
+    
+    def __init__(self, path: str, ttl: float = 3600):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            path: SQLite database file path
+            ttl: Seconds before a cached response expires
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        # WAL lets several worker processes read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        
+        logger.info(f"ResponseCache initialized at: {path}")
+    
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from request parameters
+        
+        Args:
+            params: Request query parameters
+        
+        Returns:
+            Hex digest of the sorted parameters, excluding credentials
+        """
+        items = sorted((k, str(v)) for k, v in params.items() if k not in _IGNORED_PARAMS)
+        return hashlib.sha1(orjson.dumps(items)).hexdigest()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read a cached response body (blocking - run in a thread pool)
+        
+        Args:
+            key: Key from make_key()
+        
+        Returns:
+            Response body or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body FROM responses WHERE key = ? AND stored_at > ?",
+                    (key, time.time() - self.ttl)
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+    
+    def set(self, key: str, body: bytes):
+        """
+        Store a response body and drop expired rows (blocking - run in a thread pool)
+        
+        Args:
+            key: Key from make_key()
+            body: Raw response body
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, stored_at) VALUES (?, ?, ?)",
+                    (key, body, now)
+                )
+                self._conn.execute("DELETE FROM responses WHERE stored_at <= ?", (now - self.ttl,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {str(e)}")
+    
+    def close(self):
+        """
+        Close the database connection
+        """
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,107 @@
+"""
+Semantic Search Cache Module
+Reuses cached search results for queries that are worded differently but mean the same
+"""
+
+import time
+import logging
+from typing import Any, List, Optional
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Near-match cache keyed by sentence embeddings of search queries
+    """
+    
+    def __init__(
+        self,
+        model_name: str,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        ttl: float = 600
+    ):
+        """
+        Load the embedding model and allocate cache storage
+        
+        Args:
+            model_name: sentence-transformers model name
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached queries
+            ttl: Seconds before a cached entry expires
+        """
+        self._model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.ttl = ttl
+        
+        dim = self._model.get_sentence_embedding_dimension()
+        # Unit-length embeddings stored in float16, so cosine similarity is a plain dot product
+        self._embeddings = np.zeros((max_entries, dim), dtype=np.float16)
+        self._results: List[Optional[Any]] = [None] * max_entries
+        self._stored_at = np.zeros(max_entries, dtype=np.float64)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)  # 0 marks an empty slot
+        self._clock = 0
+        
+        logger.info(f"SemanticCache initialized with model: {model_name}")
+    
+    def encode(self, query: str) -> np.ndarray:
+        """
+        Embed a query (blocking - run in a thread pool)
+        
+        Args:
+            query: Search query
+        
+        Returns:
+            Unit-length float16 embedding
+        """
+        embedding = self._model.encode(query, normalize_embeddings=True)
+        return embedding.astype(np.float16)
+    
+    def lookup(self, embedding: np.ndarray) -> Optional[Any]:
+        """
+        Find cached results for the most similar live query
+        
+        Args:
+            embedding: Query embedding from encode()
+        
+        Returns:
+            Cached results or None if no entry is similar enough
+        """
+        live = (self._last_used > 0) & (time.monotonic() - self._stored_at < self.ttl)
+        if not live.any():
+            return None
+        
+        sims = self._embeddings @ embedding
+        sims[~live] = -1
+        best = int(sims.argmax())
+        if sims[best] < self.threshold:
+            return None
+        
+        self._touch(best)
+        logger.debug(f"Semantic cache hit (similarity {float(sims[best]):.3f})")
+        return self._results[best]
+    
+    def add(self, embedding: np.ndarray, results: Any):
+        """
+        Store results for a query, evicting the least recently used entry when full
+        
+        Args:
+            embedding: Query embedding from encode()
+            results: Search results to cache
+        """
+        slot = int(self._last_used.argmin())
+        self._embeddings[slot] = embedding
+        self._results[slot] = results
+        self._stored_at[slot] = time.monotonic()
+        self._touch(slot)
+    
+    def _touch(self, slot: int):
+        """
+        Mark a slot as most recently used
+        """
+        self._clock += 1
+        self._last_used[slot] = self._clock
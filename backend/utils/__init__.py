@@ -4,16 +4,30 @@ Utils package initialization
 
 from .helpers import (
     is_valid_url,
+    normalize_url,
+    article_dedup_key,
     clean_text,
     extract_domain,
     truncate_text,
-    calculate_text_similarity
+    calculate_text_similarity,
+    calculate_text_similarity_batch,
+    calculate_tfidf_similarity_batch,
+    minhash_signature,
+    get_minhash_signature,
+    estimate_text_similarity
 )
 
 __all__ = [
     'is_valid_url',
+    'normalize_url',
+    'article_dedup_key',
     'clean_text',
     'extract_domain',
     'truncate_text',
-    'calculate_text_similarity'
+    'calculate_text_similarity',
+    'calculate_text_similarity_batch',
+    'calculate_tfidf_similarity_batch',
+    'minhash_signature',
+    'get_minhash_signature',
+    'estimate_text_similarity'
 ]
@@ -3,8 +3,41 @@ Utility functions for the News Verification API
 """
 
 import re
-from typing import Optional
-from urllib.parse import urlparse
+import zlib
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+
+import numpy as np
+
+# MinHash parameters: multiply-add-shift hashes ((a * x + b) mod 2**64) >> 32
+# with a fixed seed so signatures are comparable across calls
+MINHASH_PERMUTATIONS = 128
+MINHASH_CACHE_SIZE = 4096
+_minhash_rng = np.random.default_rng(1)
+_MINHASH_A = _minhash_rng.integers(0, 1 << 63, MINHASH_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_MINHASH_B = _minhash_rng.integers(0, 1 << 63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+_minhash_cache: "OrderedDict[str, Optional[np.ndarray]]" = OrderedDict()
+
+# Memoized urlparse - the same URLs are validated and parsed repeatedly per request
+_urlparse_cached = lru_cache(maxsize=2048)(urlparse)
+
+# Word sets of texts up to this length are memoized for repeated similarity checks
+WORD_SET_CACHE_MAX_CHARS = 10000
+
+# TF-IDF tokens: runs of two or more word characters, so one-letter words are ignored
+_TERM_RE = re.compile(r'\w\w+')
+
+# Patterns used by clean_text
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_RE = re.compile(r'[^\w\s\.,!?;:\-\'"()]')
+
+# Deletion table matching _SPECIAL_RE over ASCII, for the clean_text fast path
+_ASCII_SPECIAL_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128))
+    if not (c.isalnum() or c == '_' or c.isspace() or c in '.,!?;:-\'"()')
+))
 
 
 def is_valid_url(url: str) -> bool:
@@ -18,12 +51,49 @@ def is_valid_url(url: str) -> bool:
         True if valid URL, False otherwise
     """
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        result = _urlparse_cached(url)
+        return bool(result.scheme) and bool(result.netloc)
     except Exception:
         return False
 
 
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache or deduplication key
+    Lowercases scheme and host, sorts query parameters, drops the fragment
+    and any trailing slash
+    
+    Args:
+        url: URL string
+    
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def article_dedup_key(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Build a duplicate-detection key for an article URL
+    Looser than normalize_url: also ignores scheme and query string, so the
+    same article linked with tracking parameters counts as a duplicate
+    
+    Args:
+        url: Article URL
+    
+    Returns:
+        Tuple of (host, path) or None if the URL cannot be parsed
+    """
+    try:
+        parsed = _urlparse_cached(url)
+        return parsed.netloc.lower(), parsed.path.rstrip('/')
+    except ValueError:
+        return None
+
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize text content
@@ -34,11 +104,15 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
     # Remove special characters but keep punctuation
-    text = re.sub(r'[^\w\s\.,!?;:\-\'"()]', '', text)
+    if text.isascii():
+        # Fast path: C-level translate instead of a regex scan
+        text = text.translate(_ASCII_SPECIAL_TABLE)
+    else:
+        text = _SPECIAL_RE.sub('', text)
+    
+    # Remove extra whitespace
+    text = _WHITESPACE_RE.sub(' ', text)
     
     return text.strip()
 
@@ -54,7 +128,7 @@ def extract_domain(url: str) -> Optional[str]:
         Domain name or None
     """
     try:
-        parsed = urlparse(url)
+        parsed = _urlparse_cached(url)
         return parsed.netloc
     except Exception:
         return None
@@ -74,14 +148,30 @@ def truncate_text(text: str, max_length: int = 1000) -> str:
     if len(text) <= max_length:
         return text
     
-    # Try to truncate at sentence boundary
-    truncated = text[:max_length]
-    last_period = truncated.rfind('.')
+    # Try to truncate at sentence boundary, scanning only the last 20%
+    last_period = text.rfind('.', int(max_length * 0.8) + 1, max_length)
     
-    if last_period > max_length * 0.8:  # If period is in last 20%
-        return truncated[:last_period + 1]
+    if last_period != -1:
+        return text[:last_period + 1]
     
-    return truncated + "..."
+    return text[:max_length] + "..."
+
+
+@lru_cache(maxsize=4096)
+def _cached_word_set(text: str) -> frozenset:
+    """
+    Lowercased word set of a text (memoized)
+    """
+    return frozenset(text.lower().split())
+
+
+def _word_set(text: str) -> frozenset:
+    """
+    Lowercased word set of a text, cached unless the text is very long
+    """
+    if len(text) <= WORD_SET_CACHE_MAX_CHARS:
+        return _cached_word_set(text)
+    return frozenset(text.lower().split())
 
 
 def calculate_text_similarity(text1: str, text2: str) -> float:
@@ -96,13 +186,162 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     Returns:
         Similarity score between 0 and 1
     """
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
+    words1 = _word_set(text1)
+    words2 = _word_set(text2)
     
     if not words1 or not words2:
         return 0.0
     
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
+    intersection = len(words1 & words2)
+    union = len(words1) + len(words2) - intersection
+    
+    return intersection / union
+
+
+def calculate_text_similarity_batch(text: str, texts: List[str]) -> np.ndarray:
+    """
+    Calculate word-overlap similarity between one text and many others
+    Vectorized equivalent of calling calculate_text_similarity per pair
+    
+    Args:
+        text: Reference text
+        texts: Texts to compare against
+    
+    Returns:
+        Array of similarity scores between 0 and 1, one per entry in texts
+    """
+    words = _word_set(text)
+    word_sets = [_word_set(t) for t in texts]
+    if not words or not texts:
+        return np.zeros(len(texts), dtype=np.float64)
+    
+    # Boolean document-term matrix: row 0 is the reference text
+    vocab = {w: i for i, w in enumerate(words.union(*word_sets))}
+    matrix = np.zeros((len(texts) + 1, len(vocab)), dtype=bool)
+    matrix[0, [vocab[w] for w in words]] = True
+    for row, ws in enumerate(word_sets, 1):
+        if ws:
+            matrix[row, [vocab[w] for w in ws]] = True
     
-    return len(intersection) / len(union)
+    intersection = (matrix[0] & matrix[1:]).sum(axis=1)
+    union = (matrix[0] | matrix[1:]).sum(axis=1)
+    return intersection / np.maximum(union, 1)
+
+
+@lru_cache(maxsize=4096)
+def _cached_term_counts(text: str) -> Dict[str, int]:
+    """
+    Lowercased term counts of a text (memoized, do not mutate)
+    """
+    return Counter(_TERM_RE.findall(text.lower()))
+
+
+def _term_counts(text: str) -> Dict[str, int]:
+    """
+    Lowercased term counts of a text, cached unless the text is very long
+    """
+    if len(text) <= WORD_SET_CACHE_MAX_CHARS:
+        return _cached_term_counts(text)
+    return Counter(_TERM_RE.findall(text.lower()))
+
+
+def calculate_tfidf_similarity_batch(text: str, texts: List[str]) -> np.ndarray:
+    """
+    Calculate TF-IDF cosine similarity between one text and many others
+    Terms common to every text are down-weighted, unlike word-overlap similarity.
+    IDF is computed over the reference text and texts together (smoothed, as in scikit-learn)
+    
+    Args:
+        text: Reference text
+        texts: Texts to compare against
+    
+    Returns:
+        Array of similarity scores between 0 and 1, one per entry in texts
+    """
+    counts = [_term_counts(t) for t in (text, *texts)]
+    if not counts[0] or not texts:
+        return np.zeros(len(texts), dtype=np.float64)
+    
+    # Term-frequency matrix: row 0 is the reference text
+    vocab: Dict[str, int] = {}
+    for c in counts:
+        for term in c:
+            vocab.setdefault(term, len(vocab))
+    matrix = np.zeros((len(counts), len(vocab)), dtype=np.float64)
+    for row, c in enumerate(counts):
+        if c:
+            matrix[row, [vocab[term] for term in c]] = list(c.values())
+    
+    doc_freq = np.count_nonzero(matrix, axis=0)
+    matrix *= np.log((1 + len(counts)) / (1 + doc_freq)) + 1
+    
+    # L2-normalize rows so the dot product is the cosine
+    norms = np.linalg.norm(matrix, axis=1)
+    matrix /= np.maximum(norms, 1e-12)[:, None]
+    return np.clip(matrix[1:] @ matrix[0], 0.0, 1.0)
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    Compute a MinHash signature of the text's word set
+    
+    Args:
+        text: Text to fingerprint
+    
+    Returns:
+        uint32 array of MINHASH_PERMUTATIONS values, or None for empty text
+    """
+    words = set(text.lower().split())
+    if not words:
+        return None
+    
+    hashes = np.fromiter(
+        (zlib.crc32(w.encode('utf-8')) for w in words),
+        dtype=np.uint64,
+        count=len(words)
+    )
+    # uint64 arithmetic wraps, giving the mod 2**64 for free
+    permuted = (np.outer(_MINHASH_A, hashes) + _MINHASH_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def get_minhash_signature(url: str, text: str) -> Optional[np.ndarray]:
+    """
+    Get the MinHash signature for an article, computing it once per URL
+    
+    Args:
+        url: Article URL used as the cache key
+        text: Article text
+    
+    Returns:
+        MinHash signature or None for empty text
+    """
+    if url in _minhash_cache:
+        _minhash_cache.move_to_end(url)
+        return _minhash_cache[url]
+    
+    signature = minhash_signature(text)
+    _minhash_cache[url] = signature
+    if len(_minhash_cache) > MINHASH_CACHE_SIZE:
+        _minhash_cache.popitem(last=False)
+    return signature
+
+
+def estimate_text_similarity(
+    signature1: Optional[np.ndarray],
+    signature2: Optional[np.ndarray]
+) -> float:
+    """
+    Estimate word-overlap (Jaccard) similarity from two MinHash signatures
+    
+    Args:
+        signature1: First signature
+        signature2: Second signature
+    
+    Returns:
+        Estimated similarity score between 0 and 1
+    """
+    if signature1 is None or signature2 is None:
+        return 0.0
+    return float(np.count_nonzero(signature1 == signature2)) / len(signature1)